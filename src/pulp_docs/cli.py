@@ -44,6 +44,18 @@ no_reload_help = "Disable the live reloading in the development server."
     is_flag=True,
     help="Whether to clear the cache before serving (default=False).",
 )
+@click.option(
+    "--git-clone",
+    default=False,
+    is_flag=True,
+    help="Download remote repositories with git instead of tarballs (default=False).",
+)
+@click.option(
+    "--copy",
+    default=False,
+    is_flag=True,
+    help="Copy the repositories files instead of symlinking them (default=False).",
+)
 @click.option("--verbose", "-v", is_flag=True)
 @click.option(
     "-w",
@@ -67,6 +79,8 @@ no_reload_help = "Disable the live reloading in the development server."
 def serve(
     ctx: PulpDocsContext,
     clear_cache: bool,
+    git_clone: bool,
+    copy: bool,
     verbose: bool,
     watch: t.List[Path],
     livereload: bool,
@@ -77,6 +91,8 @@ def serve(
     pulpdocs = ctx.pulp_docs
 
     config.clear_cache = clear_cache
+    config.git_clone = git_clone
+    config.link = not copy
     config.verbose = verbose
     config.watch = watch
     config.livereload = livereload
@@ -30,6 +30,8 @@ class Config:
         mkdocs_file: the base mkdocs used in serving/building
         repolist: the configuration repositories (which and how to fetch)
         clear_cache: whether to clear cache before downloading from remote
+        git_clone: whether to download from remote with git instead of tarballs
+        link: whether to symlink the repositories files instead of copying them
     """
 
     def __init__(self, from_environ: bool = False):
@@ -39,6 +41,8 @@ class Config:
             self.mkdocs_file = files("pulp_docs").joinpath("data/mkdocs.yml")
             self.repolist = files("pulp_docs").joinpath("data/repolist.yml")
             self.clear_cache = False
+            self.git_clone = False
+            self.link = True
 
             if env_mkdocs := os.environ.get("PULPDOCS_MKDOCS_FILE"):
                 self.mkdocs_file = Path(env_mkdocs)
@@ -49,6 +53,8 @@ class Config:
             self.mkdocs_file = Path(os.environ["PULPDOCS_MKDOCS_FILE"])
             self.repolist = Path(os.environ["PULPDOCS_REPOLIST"])
             self.clear_cache = cast_bool(os.environ["PULPDOCS_CLEAR_CACHE"])
+            self.git_clone = cast_bool(os.environ.get("PULPDOCS_GIT_CLONE", "f"))
+            self.link = cast_bool(os.environ.get("PULPDOCS_LINK", "t"))
             self.disabled = cast_list(os.environ.get("PULPDOCS_DISABLED", ""))
         self.watch: list[Path] = []
         self.livereload = True
@@ -15,22 +15,24 @@ It's used here mainly to:
 
 """
 
+import functools
 import json
 import logging
+import os
 import shutil
 import tempfile
 import time
+import typing as t
 from contextlib import suppress
 from pathlib import Path
 from textwrap import dedent
 
-import httpx
 import rich
 
 from pulp_docs.cli import Config
 from pulp_docs.constants import SECTION_REPO
 from pulp_docs.navigation import get_navigation
-from pulp_docs.repository import Repo, Repos, SubPackage
+from pulp_docs.repository import HTTP_CLIENT, Repo, Repos, SubPackage, _copy_file
 
 # the name of the docs in the source repositories
 SRC_DOCS_DIRNAME = "staging_docs"
@@ -95,7 +97,7 @@ def prepare_repositories(TMPDIR: Path, repos: Repos, config: Config):
     repo_sources = TMPDIR / "repo_sources"
     repo_docs = TMPDIR / "repo_docs"
     api_src_dir = TMPDIR / "api_json"
-    shutil.rmtree(repo_sources, ignore_errors=True)
+    # repo_sources is kept: each repo download refreshes its own dir, if needed
     shutil.rmtree(repo_docs, ignore_errors=True)
 
     # assure subpackages are last, because they depend on their repo parent
@@ -104,17 +106,24 @@ def prepare_repositories(TMPDIR: Path, repos: Repos, config: Config):
     all_repos = normal_repos + subpackages
 
     # Download/copy source code to tmpdir
+    start = time.perf_counter()
+    repos.download_all(
+        repo_sources,
+        clear_cache=config.clear_cache,
+        disabled=config.disabled,
+        use_git=config.git_clone,
+        link=config.link,
+    )
+    end = time.perf_counter()
+    log.info(f"Downloads completed in {end - start:.2} sec")
+    _remove_stale_sources(repo_sources, {repo.name for repo in normal_repos})
+
     for repo_or_pkg in all_repos:
         start = time.perf_counter()
         # handle subpcakges nested under repositories
         this_docs_dir = repo_docs / repo_or_pkg.name
         if not isinstance(repo_or_pkg, SubPackage):
             this_src_dir = repo_sources / repo_or_pkg.name
-            repo_or_pkg.download(
-                dest_dir=this_src_dir,
-                clear_cache=config.clear_cache,
-                disabled=config.disabled,
-            )
         else:
             this_src_dir = repo_sources / repo_or_pkg.subpackage_of / repo_or_pkg.name
             repo_or_pkg.version = f"same as {repo_or_pkg.subpackage_of}"
@@ -144,6 +153,19 @@ def prepare_repositories(TMPDIR: Path, repos: Repos, config: Config):
     return (repo_docs, repo_sources)
 
 
+def _remove_stale_sources(repo_sources: Path, repo_names: t.Set[str]):
+    """Remove the sources of repositories which are not in @repo_names anymore."""
+    with suppress(FileNotFoundError), os.scandir(repo_sources) as it:
+        for entry in it:
+            if entry.name in repo_names:
+                continue
+            log.info(f"Removing stale repository source: {entry.name}")
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                os.unlink(entry.path)
+
+
 def _download_api_json(api_dir: Path, repo_name: str, app_label: str):
     api_json_path = api_dir / f"{repo_name}/api.json"
     if api_json_path.exists():
@@ -152,7 +174,7 @@ def _download_api_json(api_dir: Path, repo_name: str, app_label: str):
 
     log.info(f"Downloading api.json for {repo_name}")
     api_url = f"https://raw.githubusercontent.com/pulp/pulp-docs/docs-data/data/openapi_json/{app_label}-api.json"
-    response = httpx.get(api_url)
+    response = HTTP_CLIENT.get(api_url)
     if response.is_error:
         raise Exception("Couldnt get rest api schema for {app_label}")
 
@@ -267,6 +289,8 @@ def _generate_rest_api_page(docs_dir: Path, repo_name: str, repo_title: str):
     log.info("Generating REST_API page")
     rest_api_page = docs_dir / "restapi.md"
     rest_api_page.parent.mkdir(parents=True, exist_ok=True)
+    # don't write through a symlink into the repository source
+    rest_api_page.unlink(missing_ok=True)
     # rest_api_page.write_text(RESTAPI_TEMPLATE.format(repo_title=repo_title))
     rest_api_page.write_text(RESTAPI_TEMPLATE)
 
@@ -368,15 +392,18 @@ def define_env(env):
     pulpcore_inside_pulp_cli = source_dir / "pulp-cli/pulpcore"
     pulpcore_dir_exists = Path(source_dir / "pulpcore/pulpcore").exists()
     if pulpcore_dir_exists and pulpcore_inside_pulp_cli.exists():
+        # repo_sources files may be symlinks to the sources: replace, don't write to
         shutil.copytree(
             source_dir / "pulp-cli/pulpcore",
             source_dir / "pulpcore/pulpcore",
+            copy_function=_copy_file,
             dirs_exist_ok=True,
         )
-        Path(source_dir / "pulpcore/pulpcore/cli/__init__.py").touch(exist_ok=True)
-        Path(source_dir / "pulpcore/pulpcore/cli/common/__init__.py").touch(
-            exist_ok=True
-        )
+        for init_file in ("cli/__init__.py", "cli/common/__init__.py"):
+            init_path = source_dir / "pulpcore/pulpcore" / init_file
+            if not init_path.exists():
+                init_path.unlink(missing_ok=True)  # a dangling symlink
+                init_path.touch()
 
     try:
         env.conf["plugins"]["mkdocstrings"].config["handlers"]["python"][
@@ -416,7 +443,10 @@ def define_env(env):
     env.conf["pulp_config"] = config
 
     # Extra config
+    # The repos don't change after this point, so each table is built once per build,
+    # instead of once per page which renders it.
     @env.macro
+    @functools.lru_cache(maxsize=None)
     def get_repos(repo_type="content"):
         "Return repo names by type"
         _repo_type = [repo_type] if repo_type else None
@@ -452,7 +482,7 @@ def define_env(env):
     @env.macro
     def rss_items():
         # that's Himdel's rss feed: https://github.com/himdel
-        response = httpx.get("https://himdel.eu/feed/pulp-changes.json")
+        response = HTTP_CLIENT.get("https://himdel.eu/feed/pulp-changes.json")
         if response.is_error:
             return {
                 "items": [
@@ -32,6 +32,10 @@ from pathlib import Path
 from pulp_docs.repository import Repos
 from pulp_docs.utils.aggregation import AgregationUtils
 
+PERSONA_TEMPLATE_STR = "{repo}/docs/{persona}/{content}"
+USER_PERSONAS = ("user", "admin")
+DEV_PERSONAS = ("dev",)
+
 
 def get_navigation(tmpdir: Path, repos: Repos):
     """
@@ -58,30 +62,21 @@ def grouped_by_persona(tmpdir: Path, repos: Repos):
     f = AgregationUtils(tmpdir, repos)
 
     # Manual section for each persona
-    TEMPLATE_STR = "{repo}/docs/{persona}/{content}"
-    manual_nav = {
-        "user": [
-            {"Overview": "user/index.md"},
-            *f.repo_grouping(TEMPLATE_STR, personas=["user", "admin"]),
-        ],
-        "dev": [
-            {"Overview": "dev/index.md"},
-            *f.repo_grouping(TEMPLATE_STR, personas=["dev"]),
-        ],
-    }
-
-    # Custom help section
-    help_section = [
-        {"Overview": "help/index.md"},
-        {"Community": "help/community/"},
-        {"More": "help/more/"},
-    ]
+    user_repos_nav = f.repo_grouping(PERSONA_TEMPLATE_STR, personas=USER_PERSONAS)
+    dev_repos_nav = f.repo_grouping(PERSONA_TEMPLATE_STR, personas=DEV_PERSONAS)
 
     navigation = [
         {"Home": "index.md"},
-        {"User Manual": manual_nav["user"]},
-        {"Developer Manual": manual_nav["dev"]},
+        {"User Manual": [{"Overview": "user/index.md"}, *user_repos_nav]},
+        {"Developer Manual": [{"Overview": "dev/index.md"}, *dev_repos_nav]},
         {"Blog": ["blog/index.md"]},
-        {"Help": help_section},
+        # Custom help section
+        {
+            "Help": [
+                {"Overview": "help/index.md"},
+                {"Community": "help/community/"},
+                {"More": "help/more/"},
+            ]
+        },
     ]
     return navigation
@@ -6,14 +6,23 @@ Their purpose is to facilitate declaring and downloading the source-code.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import inspect
+import io
+import json
 import logging
+import os
 import shutil
 import subprocess
 import tarfile
 import tempfile
+import threading
+import time
 import typing as t
-from dataclasses import dataclass, field
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 import httpx
@@ -21,34 +30,110 @@ import configparser
 import tomllib
 import yaml
 
-from pulp_docs.utils.general import get_git_ignored_files
+from pulp_docs.constants import BASE_TMPDIR_NAME
+from pulp_docs.utils.general import (
+    YamlLoader,
+    copy_tree,
+    ignore_patterns,
+)
+
+# Optional: clone in-process with libgit2 instead of spawning git processes
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore
 
 log = logging.getLogger("mkdocs")
 
 FIXTURE_WORKDIR = Path("tests/fixtures").absolute()
-DOWNLOAD_CACHE_DIR = Path(tempfile.gettempdir()) / "repo_downloads"
+DOWNLOAD_CACHE_DIR = Path(tempfile.gettempdir()).absolute() / "repo_downloads"
+YAML_CACHE_DIR = Path(tempfile.gettempdir()) / BASE_TMPDIR_NAME / "yaml_cache"
+STAMP_FILENAME = ".pulp-docs-stamp"
+
+DOWNLOAD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _create_http_client() -> httpx.Client:
+    """Create the HTTP client, using HTTP/2 if the optional 'h2' package is installed."""
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.Client(http2=http2, follow_redirects=True, timeout=httpx.Timeout(30.0))
+
+
+HTTP_CLIENT = _create_http_client()
+"""Shared HTTP client, so connections (and TLS sessions) are pooled across requests."""
+atexit.register(HTTP_CLIENT.close)
+
+
+_clear_cache_lock = threading.Lock()
+_clear_cache_done = False
+
+
+def clear_download_cache():
+    """
+    Clear DOWNLOAD_CACHE_DIR, once per process.
+
+    The cache dir is renamed aside and removed in a background thread, so downloads
+    can start right away instead of waiting for all cached repos to be deleted. Trash
+    dirs left behind by processes which exited before finishing are removed as well.
+    """
+    global _clear_cache_done
+    with _clear_cache_lock:
+        if _clear_cache_done:
+            return
+        _clear_cache_done = True
+        log.info("Clearing cache dir")
+        trash_prefix = f".{DOWNLOAD_CACHE_DIR.name}-trash-"
+        if DOWNLOAD_CACHE_DIR.exists():
+            trash = DOWNLOAD_CACHE_DIR.with_name(
+                f"{trash_prefix}{os.getpid()}-{time.time_ns()}"
+            )
+            os.rename(DOWNLOAD_CACHE_DIR, trash)
+        DOWNLOAD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if trash_dirs := list(DOWNLOAD_CACHE_DIR.parent.glob(f"{trash_prefix}*")):
+            threading.Thread(
+                target=_remove_dirs, args=(trash_dirs,), daemon=True
+            ).start()
+
+
+def _remove_dirs(paths: t.List[Path]):
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
 
 
-# @dataclass # raising errors in py311/312
+_CACHE_LOCKS: t.Dict[Path, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(path: Path) -> threading.Lock:
+    """Get the process-wide lock of a cache {path}, creating it if needed."""
+    with _LOCKS_GUARD:
+        return _CACHE_LOCKS.setdefault(path, threading.Lock())
+
+
+@dataclass(slots=True)
 class RepoStatus:
     """
     Usefull status information about a downloaded repository.
     """
 
-    def __init__(self, **kwargs):
-        self.download_source = kwargs.get("download_source", None)
-        self.use_local_checkout = kwargs.get("use_local_checkout", False)
-        self.has_readme = kwargs.get("has_readme", True)
-        self.has_changelog = kwargs.get("has_changelog", True)
-        self.has_staging_docs = kwargs.get("has_staging_docs", True)
-        self.using_cache = kwargs.get("using_cache", False)
-        self.original_refs = kwargs.get("original_refs", None)
+    download_source: t.Optional[str] = None
+    use_local_checkout: bool = False
+    has_readme: bool = True
+    has_changelog: bool = True
+    has_staging_docs: bool = True
+    using_cache: bool = False
+    original_refs: t.Optional[str] = None
 
     def __str__(self):
-        return str(self.__dict__)
+        return str(asdict(self))
 
 
-@dataclass
+@dataclass(slots=True)
 class Repo:
     """
     A git/gh repository representation.
@@ -63,7 +148,7 @@ class Repo:
     branch_in_use: t.Optional[str] = None
     local_basepath: t.Optional[Path] = None
     subpackages: t.Optional[t.List] = None
-    status: RepoStatus = field(default_factory=lambda: RepoStatus())
+    status: RepoStatus = field(default_factory=RepoStatus)
     type: t.Optional[str] = None
     dev_only: bool = False
     version: t.Optional[str] = None
@@ -74,7 +159,12 @@ class Repo:
         self.branch_in_use = self.branch_in_use or self.branch
 
     def download(
-        self, dest_dir: Path, clear_cache: bool = False, disabled: t.Sequence[str] = []
+        self,
+        dest_dir: Path,
+        clear_cache: bool = False,
+        disabled: t.Sequence[str] = [],
+        link: bool = True,
+        use_git: bool = False,
     ) -> str:
         """
         Download repository source from url into the {dest_dir} Path.
@@ -88,18 +178,27 @@ class Repo:
         Args:
             dest: The destination directory where source files will be saved.
                 e.g /tmp/pulp-tmp/repo_sources/pulpcore
-            clear_cache: Whether the cache should be cleared before downloading.
+            clear_cache: Deprecated. Use `Repos.download_all(..., clear_cache=True)`,
+                which clears the cache once before downloading concurrently.
+            link: Whether files should be symlinked from the source instead of copied.
+                Directories are still created, so new files can be added safely, but
+                writing to an existing file writes to the source (e.g, a local
+                checkout). Unlink it before writing.
+            use_git: Whether remote downloads should use a (sparse) git clone instead
+                of the branch tarball.
         Returns:
             The download url used
         """
-        log.info("Downloading '{}' to '{}'".format(self.name, dest_dir.absolute()))
+        if log.isEnabledFor(logging.INFO):
+            log.info("Downloading '%s' to '%s'", self.name, dest_dir.absolute())
 
         if clear_cache is True:
-            log.info("Clearing cache dir")
-            shutil.rmtree(DOWNLOAD_CACHE_DIR, ignore_errors=True)
-            DOWNLOAD_CACHE_DIR.mkdir()
+            log.warning(
+                "Repo.download(clear_cache=True) is deprecated and ignored. "
+                "Use Repos.download_all(..., clear_cache=True) instead."
+            )
 
-        cached_repo = Path(DOWNLOAD_CACHE_DIR / self.name).absolute()
+        cached_repo = DOWNLOAD_CACHE_DIR / self.name
         download_from = cached_repo
         src_copy_path = cached_repo
         log_header = ""
@@ -107,42 +206,69 @@ class Repo:
         # from local filesystem
         if self.local_basepath is not None:
             log_header = "Using local checkout"
-            download_from = Path(self.local_basepath / self.name).absolute()
+            download_from = (self.local_basepath / self.name).absolute()
             src_copy_path = download_from
-        # from cache
-        elif cached_repo.exists():
-            log_header = "Using cache in tmpdir"
-            download_from = cached_repo
-            src_copy_path = cached_repo
-            self.status.using_cache = True
-        # from remote
-        elif not cached_repo.exists():
-            log_header = "Downloading from remote"
-            src_copy_path = DOWNLOAD_CACHE_DIR / self.name
-            download_from = download_from_gh_main(
-                src_copy_path,
-                self.owner,
-                self.name,
-                self.branch_in_use,
-            )
+        else:
+            # concurrent downloads of the same repo wait for the first one to fill
+            # the cache, then use it
+            with _lock_for(cached_repo):
+                # from cache
+                if cached_repo.exists():
+                    log_header = "Using cache in tmpdir"
+                    self.status.using_cache = True
+                # from remote
+                else:
+                    log_header = "Downloading from remote"
+                    download_fn = (
+                        download_from_gh_main if use_git else download_tarball_from_gh
+                    )
+                    download_from = download_fn(
+                        src_copy_path,
+                        self.owner,
+                        self.name,
+                        self.branch_in_use,
+                    )
 
         # copy from source/cache to pulp-docs workdir
-        log.info(f"{log_header}: source={download_from}, copied_from={src_copy_path}")
+        log.info(
+            "%s: source=%s, copied_from=%s", log_header, download_from, src_copy_path
+        )
 
-        # ignore files lisetd in .gitignore and files that starts with "."
-        # shutil ignore limitation: https://github.com/Miserlou/Zappa/issues/692#issuecomment-283012663
-        ignore_patterns = get_git_ignored_files(Path(src_copy_path)) + [".*"]
+        # ignore tests and files that starts with "." (plus the .gitignore'd files,
+        # which copy_tree collects while walking the tree)
+        ignored = ["tests", ".*"]
 
         # skip blog for faster reloads
         if self.name == "pulp-docs" and "blog" in disabled:
-            ignore_patterns.append("*posts")
-
-        shutil.copytree(
-            src_copy_path,
-            dest_dir,
-            ignore=shutil.ignore_patterns(*ignore_patterns),
-            dirs_exist_ok=True,
-        )
+            ignored.append("*posts")
+
+        # hardlink from the cache (which pulp-docs never writes to) when possible
+        copy_function: t.Callable[[str, str], t.Any] = _copy_file
+        if link:
+            copy_function = _symlink_file
+        elif src_copy_path == cached_repo:
+            dest_dir.parent.mkdir(parents=True, exist_ok=True)
+            if os.stat(src_copy_path).st_dev == os.stat(dest_dir.parent).st_dev:
+                copy_function = _hardlink_file
+
+        # skip the copy if {dest_dir} has an up-to-date copy of the (immutable) cache
+        stamp = None
+        stamp_file = dest_dir / STAMP_FILENAME
+        if src_copy_path == cached_repo:
+            stamp = f"{_source_stamp(src_copy_path)}:{link}:{sorted(ignored)}"
+        if stamp is not None and _read_text(stamp_file) == stamp:
+            log.info("%s is up-to-date, skipping copy", dest_dir)
+        else:
+            shutil.rmtree(dest_dir, ignore_errors=True)
+            copy_tree(
+                src_copy_path,
+                dest_dir,
+                ignore=ignore_patterns(*ignored),
+                copy_function=copy_function,
+                gitignore=True,
+            )
+            if stamp is not None:
+                _write_text_atomic(stamp_file, stamp)
 
         # get version
         version_file = src_copy_path / ".bumpversion.cfg"
@@ -164,7 +290,7 @@ class Repo:
         template_config_file = src_copy_path / "template_config.yml"
         if template_config_file.exists():
             self.template_config = yaml.load(
-                template_config_file.read_bytes(), Loader=yaml.SafeLoader
+                template_config_file.read_bytes(), Loader=YamlLoader
             )
             app_label_map = {
                 p["name"]: p["app_label"] for p in self.template_config["plugins"]
@@ -177,27 +303,280 @@ class Repo:
         return self.status.download_source
 
 
+def _source_stamp(path: Path) -> str:
+    """
+    Get a fingerprint of the source tree in @path.
+
+    The git HEAD commit if it's a git checkout, otherwise the dir modification time.
+    """
+    if (path / ".git").exists():
+        try:
+            cmd = ("git", "-C", str(path), "rev-parse", "HEAD")
+            return subprocess.check_output(cmd, text=True).strip()
+        except (subprocess.CalledProcessError, OSError):
+            pass  # e.g, git is not installed (the checkout may come from pygit2)
+    return str(path.stat().st_mtime_ns)
+
+
+def _read_text(path: Path) -> t.Optional[str]:
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        return None
+
+
+def _write_text_atomic(path: Path, text: str):
+    with tempfile.NamedTemporaryFile("w", dir=path.parent, delete=False) as f:
+        f.write(text)
+    os.replace(f.name, path)
+
+
+def _read_git_head(checkout_dir: Path) -> str:
+    """
+    Read the HEAD of the git checkout in {checkout_dir}.
+
+    In worktrees (and submodules) ".git" is a file pointing to the actual git dir.
+    """
+    git_dir = checkout_dir / ".git"
+    try:
+        with open(git_dir / "HEAD", "rb") as f:
+            return f.read(256).decode()
+    except NotADirectoryError:
+        gitdir = git_dir.read_text().removeprefix("gitdir: ").strip()
+        with open(checkout_dir / gitdir / "HEAD", "rb") as f:
+            return f.read(256).decode()
+
+
+def _symlink_file(src: str, dst: str):
+    """A `shutil.copytree` copy_function which symlinks {dst} to {src}."""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    os.symlink(os.path.abspath(src), dst)
+
+
+def _hardlink_file(src: str, dst: str):
+    """A `shutil.copytree` copy_function which hardlinks {dst} to {src}, or copies it."""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_file(src, dst)
+
+
+def _copy_file(src: str, dst: str):
+    """
+    A `shutil.copy2` equivalent which copies the bytes with `os.copy_file_range`.
+
+    The copy happens in the kernel (or as a reflink, on filesystems supporting it).
+    Falls back to `shutil.copyfile` where copy_file_range is unavailable.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            while size > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size)
+                if copied == 0:
+                    break
+                size -= copied
+    except (AttributeError, OSError):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+SPARSE_CHECKOUT_PATTERNS = ("/*", "!tests/", "!**/tests/")
+"""The paths checked out by `download_from_gh_main` (gitignore syntax)."""
+
+
+MIRRORS_DIR = DOWNLOAD_CACHE_DIR / "_mirrors"
+"""Bare mirrors shared by every checkout of a repository, see `download_from_gh_main`."""
+
+
 def download_from_gh_main(dest_dir: Path, owner: str, name: str, branch: str):
     """
     Download repository source-code from main
 
+    Keeps one bare partial mirror per repository in MIRRORS_DIR and checks `branch` out
+    as a worktree of it, so later downloads only fetch the updated ref. The worktree
+    is sparse, so only the blobs of the checked out paths are fetched (tests are left
+    out).
+
+    If a recent enough `pygit2` package is installed, a shallow clone is tried
+    in-process first (libgit2 supports neither partial nor sparse clones).
+
     Returns the download url.
     """
     url = f"https://github.com/{owner}/{name}.git"
-    cmd = ("git", "clone", "--depth", "1", "--branch", branch, url, str(dest_dir))
-    log.info("Downloading from Github with:\n{}".format(" ".join(cmd)))
+    if _can_clone_with_pygit2() and _clone_with_pygit2(url, dest_dir, branch):
+        return url
+
+    mirror = MIRRORS_DIR / f"{owner}_{name}.git"
+    git = ("git", "-c", "protocol.version=2")
+    commands = []
+    if not mirror.exists():
+        commands += [
+            (*git, "init", "-q", "--bare", str(mirror)),
+            (*git, "-C", str(mirror), "remote", "add", "origin", url),
+        ]
+    commands += [
+        (*git, "-C", str(mirror), "worktree", "prune"),
+        (
+            *git,
+            "-C",
+            str(mirror),
+            "fetch",
+            "--depth=1",
+            "--filter=blob:none",
+            "--no-tags",
+            "origin",
+            branch,
+        ),
+        (
+            *git,
+            "-C",
+            str(mirror),
+            "worktree",
+            "add",
+            "--detach",
+            "--no-checkout",
+            str(dest_dir),
+            "FETCH_HEAD",
+        ),
+        (
+            *git,
+            "-C",
+            str(dest_dir),
+            "sparse-checkout",
+            "set",
+            "--no-cone",
+            *SPARSE_CHECKOUT_PATTERNS,
+        ),
+        (*git, "-C", str(dest_dir), "reset", "-q", "--hard"),
+    ]
+    if log.isEnabledFor(logging.INFO):
+        log.info("Downloading from Github with:\n%s", " ".join(commands[-4]))
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        log.error(
-            f"An error ocurred while trying to download '{name}' source-code:\n{e}"
-        )
+        for cmd in commands:
+            subprocess.run(cmd, check=True)
+    except subprocess.CalledProcessError:
+        # don't leave a partial worktree behind, which would be used as cache
+        if dest_dir.exists():
+            shutil.rmtree(dest_dir, ignore_errors=True)
+            subprocess.run((*git, "-C", str(mirror), "worktree", "prune"))
         raise
 
     log.info("Done.")
     return url
 
 
+def _can_clone_with_pygit2() -> bool:
+    """Whether pygit2 is installed and supports shallow clones (pygit2>=1.14)."""
+    if pygit2 is None:
+        return False
+    try:
+        return "depth" in inspect.signature(pygit2.clone_repository).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _clone_with_pygit2(url: str, dest_dir: Path, branch: str) -> bool:
+    """
+    Make a shallow clone of {branch} into {dest_dir} with pygit2.
+
+    Returns whether it succeeded. On failure nothing is left in {dest_dir}, so the
+    caller can fall back to the git CLI.
+    """
+    log.info("Cloning from Github with pygit2 (shallow, not sparse): %s", url)
+    try:
+        pygit2.clone_repository(url, str(dest_dir), checkout_branch=branch, depth=1)
+    except BaseException as e:
+        shutil.rmtree(dest_dir, ignore_errors=True)
+        if not isinstance(e, Exception):
+            raise
+        log.warning("Cloning with pygit2 failed, falling back to git: %s", e)
+        return False
+    log.info("Done.")
+    return True
+
+
+def download_tarball_from_gh(dest_dir: Path, owner: str, name: str, branch: str):
+    """
+    Download repository source-code tarball from a branch (w/ GitHub codeload).
+
+    The archive is extracted while it is streamed, so no git process is spawned and
+    neither the '.git' objects nor the whole archive are kept around.
+
+    Returns the download url.
+    """
+    url = f"https://codeload.github.com/{owner}/{name}/tar.gz/{branch}"
+    log.info("Downloading tarball from Github with:\n%s", url)
+    extract_tarball_stream(url, dest_dir)
+    log.info("Done.")
+    return url
+
+
+def extract_tarball_stream(url: str, dest_dir: Path):
+    """
+    Stream the gzipped tarball from {url} and extract its top-level dir as {dest_dir}.
+
+    Network, decompression and extraction are pipelined, so the archive is never
+    fully buffered in memory. The top-level dir name is taken from the first member
+    and stripped from every member, so files are extracted directly into {dest_dir}.
+    On failure, the partially extracted {dest_dir} is removed.
+    """
+    dest_dir.mkdir(parents=True)
+    try:
+        with HTTP_CLIENT.stream("GET", url) as response:
+            response.raise_for_status()
+            stream = io.BufferedReader(_ResponseStream(response))
+            with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+                prefix = None
+                while (member := tar.next()) is not None:
+                    # tarfile keeps every TarInfo read, which is useless here as
+                    # (hard)links are extracted from their already extracted target
+                    tar.members.clear()
+                    prefix = prefix or member.name.split("/", 1)[0] + "/"
+                    if not member.name.startswith(prefix):
+                        continue  # the top-level dir itself
+                    member.name = member.name.removeprefix(prefix)
+                    if member.islnk():
+                        member.linkname = member.linkname.removeprefix(prefix)
+                    try:
+                        tar.extract(member, dest_dir, filter="data")
+                    except tarfile.FilterError as e:
+                        # e.g, absolute or out-of-tree symlinks, which git tolerates
+                        log.warning("Skipping unsafe tarball member: %s", e)
+        if prefix is None:
+            raise ValueError(f"Empty tarball: {url}")
+    except BaseException:
+        shutil.rmtree(dest_dir, ignore_errors=True)
+        raise
+
+
+class _ResponseStream(io.RawIOBase):
+    """Read-only file-like wrapper around a streamed httpx response body."""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.iter_bytes()
+        self._buffer = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
 def download_from_gh_latest(dest_dir: Path, owner: str, name: str):
     """
     Download repository source-code from latest GitHub Release (w/ GitHub API).
@@ -210,24 +589,16 @@ def download_from_gh_latest(dest_dir: Path, owner: str, name: str):
         "https://api.github.com/repos/{}/{}/releases/latest".format(owner, name)
     )
 
-    print("Fetching latest release with:", latest_release_link_url)
-    response = httpx.get(latest_release_link_url)
+    log.info("Fetching latest release with: %s", latest_release_link_url)
+    response = HTTP_CLIENT.get(latest_release_link_url)
     latest_release_tar_url = response.json()["tarball_url"]
 
-    print("Downloadng tarball from:", latest_release_tar_url)
-    response = httpx.get(latest_release_tar_url, follow_redirects=True)
-    bytes_data = BytesIO(response.content)
-
-    print("Extracting tarball to:", dest_dir)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        with tarfile.open(fileobj=bytes_data) as tar:
-            tar.extractall(tmpdir, filter="data")
-        # workaround because I cant know the name of the extracted dir with tarfile lib
-        dirname = Path(tmpdir) / tar.getmembers()[0].name.split()[0]
-        shutil.move(str(dirname.absolute()), str(dest_dir.absolute()))
+    log.info("Downloading tarball from: %s", latest_release_tar_url)
+    log.info("Extracting tarball to: %s", dest_dir)
+    extract_tarball_stream(latest_release_tar_url, dest_dir)
     # Reference:
-    # https://www.python-httpx.org/quickstart/#binary-response-content
-    # https://docs.python.org/3/library/tarfile.html#tarfile.TarFile.extractall
+    # https://www.python-httpx.org/async/#streaming-responses
+    # https://docs.python.org/3/library/tarfile.html#tarfile.open (stream mode "r|gz")
     return latest_release_tar_url
 
 
@@ -239,7 +610,7 @@ class SubPackage:
     title: str
     subpackage_of: str
     type: t.Optional[str] = None
-    status: RepoStatus = field(default_factory=lambda: RepoStatus())
+    status: RepoStatus = field(default_factory=RepoStatus)
     local_basepath = None
     branch_in_use = ""
     branch = ""
@@ -249,43 +620,164 @@ class SubPackage:
     app_label: t.Optional[str] = None
 
 
-@dataclass
+def load_yaml_cached(file: Path) -> t.Any:
+    """
+    Load the yaml @file, reusing a JSON copy of it while the file is unchanged.
+
+    The JSON cache lives in the tmpdir and is keyed by the file mtime and size,
+    as JSON is much faster to parse than YAML.
+    """
+    stat = file.stat()
+    signature = f"# sig: {stat.st_mtime_ns}:{stat.st_size}\n"
+    path_hash = hashlib.sha1(str(file.absolute()).encode()).hexdigest()
+    cache_path = YAML_CACHE_DIR / f"{file.stem}-{path_hash}.cache.json"
+    try:
+        with open(cache_path, "r") as f:
+            if f.readline() == signature:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    with open(file, "r") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    try:
+        content = json.dumps(data)
+    except (TypeError, ValueError) as e:
+        log.debug("Couldn't cache the yaml file '%s': %s", file, e)
+        return data
+    # e.g, non-string keys are converted to strings
+    if json.loads(content) != data:
+        log.debug("Couldn't cache the yaml file '%s': not JSON compatible", file)
+        return data
+
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=cache_path.parent, delete=False) as f:
+            tmp_name = f.name
+            f.write(signature)
+            f.write(content)
+        os.replace(tmp_name, cache_path)
+    except OSError as e:
+        log.debug("Couldn't write the yaml cache for '%s': %s", file, e)
+        if tmp_name is not None:
+            with suppress(OSError):
+                os.unlink(tmp_name)
+    return data
+
+
+@dataclass(slots=True)
 class Repos:
-    """A collection of Repos"""
+    """
+    A collection of Repos
+
+    Compared and hashed by identity, so it can be used as a cache key.
+    """
 
     repo_by_types: dict[str, Repo] = field(default_factory=dict)
+    _all: t.Tuple[t.Union[Repo, SubPackage], ...] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # The repositories don't change after Repos is created
+        repos = [
+            repo for repo_type in self.repo_by_types.values() for repo in repo_type
+        ]
+        subpackages = []
+        for repo in repos:
+            if repo.subpackages:
+                subpackages.extend(repo.subpackages)
+        self._all = tuple(sorted(repos + subpackages, key=lambda x: x.title))
 
     def update_local_checkouts(self):
         """Update repos to use local checkout, if exists in the parent dir of CWD"""
+        parent = Path().absolute().parent
+        # list the parent dir once instead of checking each repo dir
+        try:
+            with os.scandir(parent) as it:
+                present = {e.name for e in it if e.is_dir()}
+        except FileNotFoundError:
+            present = set()
+
         for repo in self.all:
-            checkout_dir = Path().absolute().parent / repo.name
-            if repo.local_basepath is None and checkout_dir.exists():
-                repo.status.use_local_checkout = True
-                repo.local_basepath = Path().absolute().parent
-                # looks like 'refs/head/main'
-                checkout_refs = Path(checkout_dir / ".git" / "HEAD").read_text()
-                checkout_refs = checkout_refs[len("ref: ") :].replace("\n", "")
-                repo.branch_in_use = checkout_refs
+            if repo.local_basepath is not None or repo.name not in present:
+                continue
+            # looks like 'refs/head/main'. Dirs which aren't git checkouts are skipped
+            try:
+                checkout_refs = _read_git_head(parent / repo.name)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            repo.status.use_local_checkout = True
+            repo.local_basepath = parent
+            repo.branch_in_use = checkout_refs.removeprefix("ref: ").rstrip("\n")
+
+    def download_all(
+        self,
+        dest_root: Path,
+        clear_cache: bool = False,
+        disabled: t.Sequence[str] = [],
+        use_git: bool = False,
+        link: bool = True,
+        max_workers: int = 8,
+    ) -> t.List[str]:
+        """
+        Download all repositories concurrently into {dest_root}/{repo.name}.
+
+        Subpackages are skipped, as they are shipped with their parent repository.
+
+        Args:
+            dest_root: The directory where each repository source will be saved.
+            clear_cache: Whether the cache should be cleared before downloading
+                (once per process, see `clear_download_cache`).
+            disabled: Disabled features (e.g, "blog"), forwarded to `Repo.download`.
+            use_git: Whether to git clone remote repos, forwarded to `Repo.download`.
+            link: Whether to symlink files instead of copying them, forwarded to
+                `Repo.download`.
+            max_workers: The maximum number of concurrent downloads.
+        Returns:
+            The download urls used, in the same order as the repositories.
+        Raises:
+            ExceptionGroup: With the errors of every failed download, after all
+                downloads have finished.
+        """
+        if clear_cache is True:
+            clear_download_cache()
+
+        repos = [repo for repo in self.all if not isinstance(repo, SubPackage)]
+        if not repos:
+            return []
+
+        def download(repo: Repo) -> str:
+            return repo.download(
+                dest_root / repo.name, disabled=disabled, use_git=use_git, link=link
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+            futures = [executor.submit(download, repo) for repo in repos]
+
+        errors = []
+        for repo, future in zip(repos, futures):
+            if error := future.exception():
+                log.error(
+                    "An error ocurred while trying to download '%s' source-code:\n%s",
+                    repo.name,
+                    error,
+                )
+                errors.append(error)
+        if errors:
+            raise ExceptionGroup("Failed to download some repositories", errors)
+        return [future.result() for future in futures]
 
     def get(self, repo_name: str) -> t.Optional[Repo]:
-        repo = [r for r in self.all if r.name == repo_name] or [None]
-        return repo[0]
+        return next((r for r in self.all if r.name == repo_name), None)
 
     @property
     def repo_types(self):
         return list(self.repo_by_types.keys())
 
     @property
-    def all(self):
+    def all(self) -> t.Tuple[t.Union[Repo, SubPackage], ...]:
         """The set of repositories and subpackages"""
-        repos = [
-            repo for repo_type in self.repo_by_types.values() for repo in repo_type
-        ]
-        subpackages = []
-        for repo in repos:
-            if repo.subpackages:
-                subpackages.extend(repo.subpackages)
-        return sorted(repos + subpackages, key=lambda x: x.title)
+        return self._all
 
     def get_repos(self, repo_types: t.Optional[t.List] = None):
         """Get a set of repositories and subpackages by type."""
@@ -319,32 +811,31 @@ class Repos:
         file = Path(path)
         if not file.exists():
             raise ValueError("File does not exist:", file)
-        log.info(f"repofile={str(file.absolute())}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("repofile=%s", file.absolute())
 
         # Create Repo objects from yaml data
         repos: t.Dict[str, t.List] = {}
         nested_packages: t.Dict[str, t.List[SubPackage]] = {}
-        with open(file, "r") as f:
-            data = yaml.load(f, Loader=yaml.SafeLoader)
-            repo_types = data["meta"]["repo_types"]
-            for repo_type in repo_types:
-                repos[repo_type] = []
-                for repo in data["repos"][repo_type]:
-                    # Collect nested packages
-                    if parent_package := repo.get("subpackage_of", None):
-                        nested_packages.setdefault(parent_package, []).append(
-                            SubPackage(**repo, type=repo_type)
-                        )
-                        continue
-                    # Create regular packages
-                    repos[repo_type].append(Repo(**repo, type=repo_type))
+        data = load_yaml_cached(file)
+        repo_types = data["meta"]["repo_types"]
+        for repo_type in repo_types:
+            repos[repo_type] = []
+            for repo in data["repos"][repo_type]:
+                # Collect nested packages
+                if parent_package := repo.get("subpackage_of", None):
+                    nested_packages.setdefault(parent_package, []).append(
+                        SubPackage(**repo, type=repo_type)
+                    )
+                    continue
+                # Create regular packages
+                repos[repo_type].append(Repo(**repo, type=repo_type))
 
         # Update Repo objects that contain subpackages
-        for parent_repo_name, subpackages_list in nested_packages.items():
-            flat_repos = [repo for type_ in repo_types for repo in repos[type_]]
-            for repo in flat_repos:
-                if repo.name == parent_repo_name:
-                    repo.subpackages = subpackages_list
+        for type_ in repo_types:
+            for repo in repos[type_]:
+                if repo.name in nested_packages:
+                    repo.subpackages = nested_packages[repo.name]
 
         return Repos(repos)
 
@@ -4,6 +4,8 @@ import tomllib
 import yaml
 import re
 
+from pulp_docs.utils.general import YamlLoader
+
 
 def parse_doctree_file(doctree_file: Path, target: Path, project_name: str = "foobar"):
     """Create a whole documentation tree base on @doctree_file on @target.
@@ -54,7 +56,7 @@ def parse_doctree_file(doctree_file: Path, target: Path, project_name: str = "fo
 
     # Open and parse doctree file
     if doctree_file.suffix in (".yml", ".yaml"):
-        data = yaml.load(doctree_file.read_text(), Loader=yaml.SafeLoader)
+        data = yaml.load(doctree_file.read_text(), Loader=YamlLoader)
     elif doctree_file.suffix in (".toml",):
         data = tomllib.loads(doctree_file.read_text())
     elif doctree_file.suffix in (".doctree",):
@@ -11,6 +11,7 @@ class AgregationUtils:
     def __init__(self, tmpdir: Path, repos: Repos):
         self.tmpdir = tmpdir
         self.repos = repos
+        self._repo_walk_cache: t.Dict[str, t.Dict[t.Tuple[str, ...], t.List[str]]] = {}
 
     def section(self, name: str, fn: t.Callable, *args, **kwargs) -> dict:
         """
@@ -35,7 +36,7 @@ class AgregationUtils:
         template_str: str,
         repo_types: t.Optional[t.List[str]] = None,
         content_types: t.Optional[t.List[str]] = None,
-        personas: t.Optional[t.List[str]] = None,
+        personas: t.Optional[t.Sequence[str]] = None,
     ):
         """
         Get all markdown files that matches @template_str basepath and group by repos.
@@ -63,7 +64,6 @@ class AgregationUtils:
             }
             ```
         """
-
         # Selected Repository, Persona and Content Type
         selected_content = content_types or [
             "tutorials",
@@ -71,11 +71,14 @@ class AgregationUtils:
             "learn",
             "reference",
         ]
+        selected_content = [(name, Names.get(name)) for name in selected_content]
 
         selected_repo_types = repo_types or self.repos.repo_types
         selected_repo_types = [(name, name.title()) for name in selected_repo_types]
 
         selected_personas = personas or ("user", "admin", "dev")
+        selected_personas = [(name, Names.get(name)) for name in selected_personas]
+        is_dev_persona = "dev" in personas if personas else True
 
         # Create navigation
         main_nav = []
@@ -87,41 +90,36 @@ class AgregationUtils:
                     continue
 
                 repo_nav = []
-                repo_basepath = self.tmpdir / repo.name
-                repo_docs_basepath = repo_basepath / "docs"
+                repo_files = self._walk_repo(repo.name)
+                repo_personas = {key[0] for key in repo_files}
 
                 persona_section = []
-                for persona in selected_personas:
+                for persona, persona_title in selected_personas:
+                    # Skip personas without any docs (e.g, repos without staging_docs)
+                    if persona not in repo_personas:
+                        continue
                     persona_nav = []
 
                     # Include index.md if present in staging_docs/{persona}/index.md
-                    persona_basepath = repo_docs_basepath / persona
-                    index_path = persona_basepath / "index.md"
-                    if index_path.exists():
-                        persona_nav.append(
-                            {"Overview": str(index_path.relative_to(self.tmpdir))}
-                        )
+                    index_path = f"{repo.name}/docs/{persona}/index.md"
+                    if index_path in repo_files.get((persona,), []):
+                        persona_nav.append({"Overview": index_path})
 
                     # Add content type for a repo/persona (guides,tutorials,etc)
-                    for content_type in selected_content:
-                        content_basepath = persona_basepath / content_type
-                        content_type_literate_nav_path = self.add_literate_nav_dir(
-                            content_basepath
-                        )
-
-                        if (
-                            content_type_literate_nav_path
-                        ):  # No content section if there are no files
-                            content_type_title = Names.get(content_type)
+                    for content_type, content_type_title in selected_content:
+                        # No content section if there are no files
+                        if repo_files.get((persona, content_type)):
+                            content_type_literate_nav_path = (
+                                f"{repo.name}/docs/{persona}/{content_type}/"
+                            )
                             persona_nav.append({content_type_title: content_type_literate_nav_path})  # type: ignore
 
                     # Add persona_nav to repo nav
                     if persona_nav:
-                        persona_title = Names.get(persona)
                         persona_section.append({persona_title: persona_nav})
 
                 # Add persona section to Repo nav
-                if len(persona_section) == 1 and "dev" in selected_personas:
+                if len(persona_section) == 1 and is_dev_persona:
                     persona_squashed = [
                         content_nav for content_nav in persona_section[0][Names.DEV]
                     ]
@@ -129,7 +127,7 @@ class AgregationUtils:
                 repo_nav.extend(persona_section)
 
                 # Add changelog and restapi
-                if "dev" not in selected_personas:
+                if not is_dev_persona:
                     CHANGES_PATH = f"{repo.name}/changes.md"
                     RESTAPI_PATH = f"{repo.name}/restapi.md"
                     PLUGIN_INDEX = f"{repo.name}/index.md"
@@ -143,6 +141,7 @@ class AgregationUtils:
                     repo_type_nav.append({repo.title: repo_nav})
             if repo_type_nav:
                 main_nav.append({repo_type_title: repo_type_nav})
+
         return main_nav or ["#"]
 
     def changes_grouping(
@@ -158,24 +157,44 @@ class AgregationUtils:
         ]
         return group_nav or ["#"]  # type: ignore
 
-    def add_literate_nav_dir(self, lookup_path: Path) -> t.Optional[str]:
-        """
-        Return str-path expandable by literate-nav or None.
-
-        If @lookup_path exists and is a dir, literate-nav can expand it with or without
-        a "_SUMMARY.md" file. Otherwise, we return None, so we can ignore this path.
+    def _walk_repo(self, repo_name: str) -> t.Dict[t.Tuple[str, ...], t.List[str]]:
         """
-        if not lookup_path.exists():
-            return None
-
-        if not lookup_path.is_dir():
-            return None
+        Get all markdown files under {repo_name}/docs, grouped by persona and content-type.
 
-        if len(list(lookup_path.rglob("*.md"))) == 0:
-            return None
+        The whole tree is walked once per repo and cached, so navigation sections can
+        be looked up in-memory instead of listing directories for every combination.
 
-        path_str = str(lookup_path.relative_to(self.tmpdir)) + "/"
-        return path_str
+        Example:
+            ```python
+            >>> self._walk_repo("repoA")
+            {
+                ("user",): ["repoA/docs/user/index.md"],
+                ("user", "guides"): ["repoA/docs/user/guides/file1.md"],
+            }
+            ```
+        """
+        if repo_name in self._repo_walk_cache:
+            return self._repo_walk_cache[repo_name]
+
+        repo_files: t.Dict[t.Tuple[str, ...], t.List[str]] = {}
+        # work with plain strings, as this runs for every directory of every repo
+        tmpdir_prefix_len = len(str(self.tmpdir)) + 1
+        docs_basepath = str(self.tmpdir / repo_name / "docs")
+        docs_prefix_len = len(docs_basepath) + 1
+        for dirpath, _, files in os.walk(docs_basepath):
+            rel_dir = dirpath[docs_prefix_len:]
+            if not rel_dir:
+                continue
+            rel_path = dirpath[tmpdir_prefix_len:]
+            md_files = [f"{rel_path}/{f}" for f in files if f.endswith(".md")]
+            if md_files:
+                key = tuple(rel_dir.split(os.sep, 2)[:2])
+                repo_files.setdefault(key, []).extend(md_files)
+        for md_files in repo_files.values():
+            md_files.sort()
+
+        self._repo_walk_cache[repo_name] = repo_files
+        return repo_files
 
     def _parse_template_str(
         self, template_str: str, repo_name: str, content_type: t.Optional[str] = None
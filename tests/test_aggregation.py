@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from pulp_docs.constants import Names
+from pulp_docs.repository import Repo, Repos
+from pulp_docs.utils.aggregation import AgregationUtils
+
+
+def create_files(basepath: Path, paths: list[str]):
+    for path in paths:
+        file = basepath / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("# title")
+
+
+def test_repo_grouping(tmp_path: Path):
+    create_files(
+        tmp_path,
+        [
+            "repoA/docs/user/index.md",
+            "repoA/docs/user/guides/foo.md",
+            "repoA/docs/user/learn/nested/bar.md",
+            "repoA/docs/admin/guides/.gitkeep",
+            "repoA/docs/dev/guides/baz.md",
+        ],
+    )
+    repos = Repos({"content": [Repo("Repo A", "repoA", type="content")]})
+    f = AgregationUtils(tmp_path, repos)
+
+    user_nav = f.repo_grouping(
+        "{repo}/docs/{persona}/{content}", personas=["user", "admin"]
+    )
+    assert user_nav == [
+        {
+            "Content": [
+                {
+                    "Repo A": [
+                        {
+                            Names.USER: [
+                                {"Overview": "repoA/docs/user/index.md"},
+                                {Names.GUIDES: "repoA/docs/user/guides/"},
+                                {Names.LEARN: "repoA/docs/user/learn/"},
+                            ]
+                        },
+                        {"REST API": "repoA/restapi.md"},
+                        {"Changelog": "repoA/changes.md"},
+                        "repoA/index.md",
+                    ]
+                }
+            ]
+        }
+    ]
+
+    dev_nav = f.repo_grouping("{repo}/docs/{persona}/{content}", personas=["dev"])
+    assert dev_nav == [
+        {"Content": [{"Repo A": [{Names.GUIDES: "repoA/docs/dev/guides/"}]}]}
+    ]
+
+
+def test_walk_repo(tmp_path: Path):
+    create_files(
+        tmp_path,
+        [
+            "repoA/docs/index.md",
+            "repoA/docs/user/index.md",
+            "repoA/docs/user/learn/b.md",
+            "repoA/docs/user/learn/nested/a.md",
+            "repoA/docs/user/learn/image.png",
+        ],
+    )
+    f = AgregationUtils(tmp_path, Repos())
+    assert f._walk_repo("repoA") == {
+        ("user",): ["repoA/docs/user/index.md"],
+        ("user", "learn"): [
+            "repoA/docs/user/learn/b.md",
+            "repoA/docs/user/learn/nested/a.md",
+        ],
+    }
+    assert f._walk_repo("missing") == {}
@@ -0,0 +1,355 @@
+import datetime
+import io
+import os
+import tarfile
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pulp_docs import repository
+from pulp_docs.repository import Repo, Repos, SubPackage, load_yaml_cached
+
+
+def test_load_yaml_cached(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(repository, "YAML_CACHE_DIR", tmp_path / "cache")
+    yaml_file = tmp_path / "repolist.yml"
+    yaml_file.write_text("repos:\n  - name: foo\n")
+
+    assert load_yaml_cached(yaml_file) == {"repos": [{"name": "foo"}]}
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    assert load_yaml_cached(yaml_file) == {"repos": [{"name": "foo"}]}
+
+    # the cache is discarded when the file changes
+    yaml_file.write_text("repos:\n  - name: foobar\n")
+    assert load_yaml_cached(yaml_file) == {"repos": [{"name": "foobar"}]}
+
+
+@pytest.mark.parametrize(
+    "content,expected",
+    [
+        pytest.param("1: one\n", {1: "one"}, id="int-keys"),
+        pytest.param(
+            "date: 2024-01-01\n", {"date": datetime.date(2024, 1, 1)}, id="date"
+        ),
+    ],
+)
+def test_load_yaml_cached_not_json_compatible(
+    tmp_path: Path, monkeypatch, content, expected
+):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(repository, "YAML_CACHE_DIR", cache_dir)
+    yaml_file = tmp_path / "repolist.yml"
+    yaml_file.write_text(content)
+
+    assert load_yaml_cached(yaml_file) == expected
+    assert load_yaml_cached(yaml_file) == expected
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+
+
+def test_update_local_checkouts(tmp_path: Path, monkeypatch):
+    (tmp_path / "repoA/.git").mkdir(parents=True)
+    (tmp_path / "repoA/.git/HEAD").write_text("ref: refs/heads/main\n")
+    # a worktree, where ".git" points to the actual git dir
+    (tmp_path / "gitdirs/repoB").mkdir(parents=True)
+    (tmp_path / "gitdirs/repoB/HEAD").write_text("1a2b3c\n")
+    (tmp_path / "repoB").mkdir()
+    (tmp_path / "repoB/.git").write_text("gitdir: ../gitdirs/repoB\n")
+    (tmp_path / "cwd").mkdir()
+    monkeypatch.chdir(tmp_path / "cwd")
+
+    # not a git checkout
+    (tmp_path / "repoD").mkdir()
+
+    repo_a, repo_b, repo_c = Repo("A", "repoA"), Repo("B", "repoB"), Repo("C", "repoC")
+    repo_d = Repo("D", "repoD")
+    Repos({"content": [repo_a, repo_b, repo_c, repo_d]}).update_local_checkouts()
+
+    assert (repo_a.local_basepath, repo_a.branch_in_use) == (
+        tmp_path,
+        "refs/heads/main",
+    )
+    assert (repo_b.local_basepath, repo_b.branch_in_use) == (tmp_path, "1a2b3c")
+    assert repo_c.local_basepath is None
+    assert repo_d.local_basepath is None
+    assert repo_d.status.use_local_checkout is False
+
+
+def test_clear_download_cache(tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "repo_downloads"
+    monkeypatch.setattr(repository, "DOWNLOAD_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(repository, "_clear_cache_done", False)
+    (cache_dir / "repoA").mkdir(parents=True)
+    # left behind by a process which exited before removing it
+    leftover_trash = tmp_path / ".repo_downloads-trash-1-1/repoB"
+    leftover_trash.mkdir(parents=True)
+
+    repository.clear_download_cache()
+    assert cache_dir.exists() and not any(cache_dir.iterdir())
+    for _ in range(50):
+        if list(tmp_path.iterdir()) == [cache_dir]:
+            break
+        time.sleep(0.01)
+    assert list(tmp_path.iterdir()) == [cache_dir]
+
+    # only once per process
+    (cache_dir / "repoB").mkdir()
+    repository.clear_download_cache()
+    assert (cache_dir / "repoB").exists()
+
+
+def test_copy_file(tmp_path: Path):
+    src, dst = tmp_path / "src.bin", tmp_path / "dst.bin"
+    src.write_bytes(bytes(range(256)) * 4096)
+    os.utime(src, (1_000_000, 1_000_000))
+
+    repository._copy_file(str(src), str(dst))
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == 1_000_000
+
+
+def test_concurrent_downloads_share_the_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(repository, "DOWNLOAD_CACHE_DIR", tmp_path / "cache")
+    calls = []
+
+    def fake_download(dest_dir: Path, owner: str, name: str, branch: str):
+        calls.append(name)
+        time.sleep(0.1)
+        (dest_dir / "docs").mkdir(parents=True)
+        (dest_dir / "docs/index.md").write_text("# title")
+        return "url"
+
+    monkeypatch.setattr(repository, "download_tarball_from_gh", fake_download)
+    repos = [Repo("A", "repoA"), Repo("A", "repoA")]
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(repo.download, tmp_path / f"dest{i}", link=False)
+            for i, repo in enumerate(repos)
+        ]
+    results = sorted(future.result() for future in futures)
+    assert results == [str(tmp_path / "cache/repoA"), "url"]
+
+    assert calls == ["repoA"]
+    for i in range(2):
+        assert (tmp_path / f"dest{i}/docs/index.md").read_text() == "# title"
+
+
+def make_tarball(members: t.Dict[str, t.Optional[str]]) -> bytes:
+    """Create a .tar.gz with @members, mapping names to content (or None for dirs)."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            if content is None:
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+            elif content.startswith("symlink:"):
+                info.type = tarfile.SYMTYPE
+                info.linkname = content.removeprefix("symlink:")
+                tar.addfile(info)
+            elif content.startswith("hardlink:"):
+                info.type = tarfile.LNKTYPE
+                info.linkname = content.removeprefix("hardlink:")
+                tar.addfile(info)
+            else:
+                data = content.encode()
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def mock_http_client(monkeypatch, status_code: int, content: bytes):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, content=content)
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(repository, "HTTP_CLIENT", client)
+
+
+def test_extract_tarball_stream(tmp_path: Path, monkeypatch):
+    tarball = make_tarball(
+        {
+            "repoA-main": None,
+            "repoA-main/docs/index.md": "# title",
+            "repoA-main/docs/copy.md": "hardlink:repoA-main/docs/index.md",
+            # unsafe members are skipped
+            "repoA-main/docs/passwd": "symlink:/etc/passwd",
+            "repoA-main/docs/outside": "symlink:../../../outside",
+        }
+    )
+    mock_http_client(monkeypatch, 200, tarball)
+
+    dest_dir = tmp_path / "repoA"
+    repository.extract_tarball_stream("https://example.com/repoA.tar.gz", dest_dir)
+
+    copied = sorted(str(p.relative_to(dest_dir)) for p in dest_dir.rglob("*"))
+    assert copied == ["docs", "docs/copy.md", "docs/index.md"]
+    assert (dest_dir / "docs/copy.md").read_text() == "# title"
+
+
+@pytest.mark.parametrize(
+    "status_code,content,error",
+    [
+        pytest.param(404, b"Not Found", httpx.HTTPStatusError, id="not-found"),
+        pytest.param(200, make_tarball({}), ValueError, id="empty"),
+        pytest.param(200, b"not a tarball", tarfile.TarError, id="corrupt"),
+    ],
+)
+def test_extract_tarball_stream_failure(
+    tmp_path: Path, monkeypatch, status_code, content, error
+):
+    mock_http_client(monkeypatch, status_code, content)
+
+    dest_dir = tmp_path / "repoA"
+    with pytest.raises(error):
+        repository.extract_tarball_stream("https://example.com/repoA.tar.gz", dest_dir)
+    assert not dest_dir.exists()
+
+
+def test_download_skips_up_to_date_copy(tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(repository, "DOWNLOAD_CACHE_DIR", cache_dir)
+    (cache_dir / "pulp-docs/docs").mkdir(parents=True)
+    (cache_dir / "pulp-docs/docs/index.md").write_text("# title")
+    repo = Repo("Docs Tool", "pulp-docs")
+    dest_dir = tmp_path / "dest"
+    marker = dest_dir / "marker"
+
+    def download_is_skipped(**kwargs) -> bool:
+        marker.touch()
+        repo.download(dest_dir, **kwargs)
+        assert (dest_dir / "docs/index.md").read_text() == "# title"
+        return marker.exists()
+
+    repo.download(dest_dir, link=False)
+    assert download_is_skipped(link=False)
+    # a different copy function or ignore list triggers a re-copy
+    assert not download_is_skipped(link=True)
+    assert not download_is_skipped(link=True, disabled=["blog"])
+    assert download_is_skipped(link=True, disabled=["blog"])
+
+
+def test_source_stamp_without_git(tmp_path: Path, monkeypatch):
+    (tmp_path / ".git").mkdir()
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+
+    assert repository._source_stamp(tmp_path) == str(tmp_path.stat().st_mtime_ns)
+
+
+def test_download_all_copies_from_cache(tmp_path: Path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(repository, "DOWNLOAD_CACHE_DIR", cache_dir)
+    (cache_dir / "repoA/docs").mkdir(parents=True)
+    (cache_dir / "repoA/docs/index.md").write_text("# title")
+
+    Repos({"content": [Repo("A", "repoA")]}).download_all(tmp_path / "dest", link=False)
+
+    # the cache is hardlinked (same filesystem), not symlinked
+    copied = tmp_path / "dest/repoA/docs/index.md"
+    assert not copied.is_symlink()
+    assert copied.stat().st_ino == (cache_dir / "repoA/docs/index.md").stat().st_ino
+
+
+def test_download_all_copies_local_checkouts(tmp_path: Path, monkeypatch):
+    checkout = tmp_path / "checkouts/repoA/docs/index.md"
+    checkout.parent.mkdir(parents=True)
+    checkout.write_text("# title")
+    copy_calls = []
+
+    def copy_file(src: str, dst: str):
+        copy_calls.append(src)
+        copy_file_range(src, dst)
+
+    copy_file_range = repository._copy_file
+    monkeypatch.setattr(repository, "_copy_file", copy_file)
+    repo = Repo("A", "repoA", local_basepath=tmp_path / "checkouts")
+    Repos({"content": [repo]}).download_all(tmp_path / "dest", link=False)
+
+    copied = tmp_path / "dest/repoA/docs/index.md"
+    assert not copied.is_symlink() and copied.read_text() == "# title"
+    assert copy_calls == [str(checkout)]
+
+
+class FakePygit2:
+    def __init__(self, error: t.Optional[Exception] = None):
+        self.error = error
+        self.clones: t.List[str] = []
+
+    def clone_repository(self, url, path, checkout_branch=None, depth=0):
+        self.clones.append(url)
+        (Path(path) / "docs").mkdir(parents=True)
+        if self.error:
+            raise self.error
+
+
+class OldFakePygit2(FakePygit2):
+    def clone_repository(self, url, path, checkout_branch=None):
+        raise AssertionError("shallow clones are not supported")
+
+
+@pytest.mark.parametrize(
+    "fake_pygit2,uses_pygit2",
+    [
+        pytest.param(FakePygit2(), True, id="pygit2"),
+        pytest.param(FakePygit2(RuntimeError("boom")), False, id="pygit2-failure"),
+        pytest.param(OldFakePygit2(), False, id="pygit2<1.14"),
+        pytest.param(None, False, id="no-pygit2"),
+    ],
+)
+def test_download_from_gh_main_pygit2(
+    tmp_path: Path, monkeypatch, fake_pygit2, uses_pygit2
+):
+    monkeypatch.setattr(repository, "pygit2", fake_pygit2)
+    monkeypatch.setattr(repository, "MIRRORS_DIR", tmp_path / "mirrors")
+    git_commands = []
+
+    def fake_run(cmd, **kwargs):
+        # the partial pygit2 clone was removed before falling back to git
+        assert not (tmp_path / "repoA").exists()
+        git_commands.append(cmd)
+
+    monkeypatch.setattr(repository.subprocess, "run", fake_run)
+
+    dest_dir = tmp_path / "repoA"
+    url = repository.download_from_gh_main(dest_dir, "pulp", "repoA", "main")
+    assert url == "https://github.com/pulp/repoA.git"
+    assert bool(git_commands) is not uses_pygit2
+
+
+def test_download_all(tmp_path: Path, monkeypatch, caplog):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(repository, "DOWNLOAD_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(repository, "_clear_cache_done", False)
+    (cache_dir / "stale").mkdir(parents=True)
+    downloaded = []
+
+    def fake_download(dest_dir: Path, owner: str, name: str, branch: str):
+        downloaded.append(name)
+        if name == "repoB":
+            raise ValueError("boom")
+        (dest_dir / "docs").mkdir(parents=True)
+        return f"url/{name}"
+
+    monkeypatch.setattr(repository, "download_tarball_from_gh", fake_download)
+    repo_a = Repo("A", "repoA")
+    repo_a.subpackages = [SubPackage("subA", "A sub", subpackage_of="repoA")]
+    repos = Repos({"content": [repo_a, Repo("B", "repoB")]})
+    assert len(repos.all) == 3
+
+    with pytest.raises(ExceptionGroup) as exc_info:
+        repos.download_all(tmp_path / "dest", clear_cache=True)
+    assert [str(e) for e in exc_info.value.exceptions] == ["boom"]
+    # subpackages are shipped with their parent repository
+    assert sorted(downloaded) == ["repoA", "repoB"]
+    assert not (cache_dir / "stale").exists()
+    errors = [r for r in caplog.records if r.levelname == "ERROR"]
+    assert len(errors) == 1 and "repoB" in errors[0].getMessage()
+
+    # the cache is only cleared once per process
+    downloaded.clear()
+    with pytest.raises(ExceptionGroup):
+        repos.download_all(tmp_path / "dest", clear_cache=True)
+    assert downloaded == ["repoB"]
@@ -0,0 +1,75 @@
+import shutil
+
+import pytest
+
+from pulp_docs.utils.general import copy_tree, ignore_patterns
+
+names = [
+    "tests",
+    "docs",
+    ".git",
+    ".github",
+    "venv",
+    ".venv",
+    "my_venv2",
+    "a.pyc",
+    "b.py",
+]
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        pytest.param(("tests", ".*"), id="literal-and-glob"),
+        pytest.param(("*venv*", "__pycache__", "*.py[co]"), id="globs"),
+        pytest.param((), id="empty"),
+    ],
+)
+def test_ignore_patterns_matches_shutil(patterns):
+    expected = shutil.ignore_patterns(*patterns)("/src", names)
+    assert ignore_patterns(*patterns)("/src", names) == expected
+
+
+def test_copy_tree(tmp_path):
+    src = tmp_path / "src"
+    for path in ("docs/index.md", "docs/tests/a.md", "tests/b.py", ".git/HEAD", "x.py"):
+        (src / path).parent.mkdir(parents=True, exist_ok=True)
+        (src / path).write_text(path)
+
+    dst = tmp_path / "dst"
+    copy_tree(src, dst, ignore=ignore_patterns("tests", ".*"))
+
+    copied = sorted(str(p.relative_to(dst)) for p in dst.rglob("*") if p.is_file())
+    assert copied == ["docs/index.md", "x.py"]
+    assert (dst / "docs/index.md").read_text() == "docs/index.md"
+
+
+def test_ignore_patterns_gitignore_semantics(tmp_path):
+    (tmp_path / "build").mkdir()
+    (tmp_path / "dist").write_text("not a dir")
+    names = ["build", "dist", "a.log", "keep.log", "docs"]
+
+    ignore = ignore_patterns("build/", "dist/", "*.log", "!keep.log")
+    assert ignore(str(tmp_path), names) == {"build", "a.log"}
+
+
+def test_copy_tree_gitignore(tmp_path):
+    src = tmp_path / "src"
+    files = {
+        ".gitignore": "# comment\n/build\n*.log\n",
+        "docs/.gitignore": "drafts/\n",
+        "docs/drafts/a.md": "",
+        "docs/index.md": "",
+        "docs/debug.log": "",
+        "build/out.txt": "",
+        "drafts/b.md": "",
+    }
+    for path, content in files.items():
+        (src / path).parent.mkdir(parents=True, exist_ok=True)
+        (src / path).write_text(content)
+
+    dst = tmp_path / "dst"
+    copy_tree(src, dst, ignore=ignore_patterns(".*"), gitignore=True)
+
+    copied = sorted(str(p.relative_to(dst)) for p in dst.rglob("*") if p.is_file())
+    assert copied == ["docs/index.md", "drafts/b.md"]